@@ -1,18 +1,20 @@
 #!/usr/bin/env python3
 """Generate a secure API key for org-bridge server."""
 
-import uuid
+import secrets
+import sys
 
-# Generate a secure API key using UUID4
-api_key = str(uuid.uuid4())
+# Generate a secure API key (32 random bytes, URL-safe base64)
+api_key = secrets.token_urlsafe(32)
 
-print(f"Generated API key: {api_key}")
-print()
-print("Add this to your environment:")
-print(f"  export ORG_BRIDGE_API_KEY={api_key}")
-print()
-print("Or add to .env file:")
-print(f"  echo 'ORG_BRIDGE_API_KEY={api_key}' >> .env")
-print()
-print("Or add to systemd service:")
-print(f"  Environment=ORG_BRIDGE_API_KEY={api_key}") 
\ No newline at end of file
+sys.stdout.write(f"""Generated API key: {api_key}
+
+Add this to your environment:
+  export ORG_BRIDGE_API_KEY={api_key}
+
+Or add to .env file:
+  echo 'ORG_BRIDGE_API_KEY={api_key}' >> .env
+
+Or add to systemd service:
+  Environment=ORG_BRIDGE_API_KEY={api_key}
+""")
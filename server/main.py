@@ -1,17 +1,113 @@
 from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 
-from org_parser import append_todo_to_file, get_inbox_file_path, validate_org_directory
+from org_parser import (
+    Durability,
+    append_todo_to_file,
+    append_todo_texts,
+    close_cached_fds,
+    get_inbox_file_path,
+    render_todo_text,
+    set_io_executor,
+    validate_org_directory,
+)
+
+# Threads in the pool that runs blocking org file I/O
+IO_POOL_WORKERS = 4
+
+# Maximum number of queued TODOs flushed to a file in one write
+WRITE_BATCH_SIZE = 64
+
+# Seconds a file's writer waits for more TODOs before it shuts down (the next
+# TODO for that file starts a new one)
+WRITER_IDLE_SECONDS = 60
+
+# Durability levels from weakest to strongest; a batch is written with the
+# strongest level any of its TODOs asked for
+DURABILITY_LEVELS = ("fast", "fsync", "atomic")
+
+
+async def _writer_loop(file_path: str, queue: asyncio.Queue):
+    """
+    Drain rendered TODOs queued for one file and append them in batches.
+    
+    Whatever piles up while a write is in flight goes out together in the
+    next write, so bursts of requests cost one write (and at most one fsync)
+    per batch. The writer retires after WRITER_IDLE_SECONDS without work, so
+    only recently written files keep a queue and a task.
+    """
+    while True:
+        try:
+            first = await asyncio.wait_for(queue.get(), WRITER_IDLE_SECONDS)
+        except asyncio.TimeoutError:
+            if not queue.empty():
+                continue
+            if app.state.write_queues.get(file_path) is queue:
+                del app.state.write_queues[file_path]
+            app.state.writer_tasks.discard(asyncio.current_task())
+            return
+        
+        batch = [first]
+        while not queue.empty() and len(batch) < WRITE_BATCH_SIZE:
+            batch.append(queue.get_nowait())
+        
+        durability = max((d for _, d, _ in batch), key=DURABILITY_LEVELS.index)
+        
+        try:
+            await append_todo_texts(file_path, [todo_bytes for todo_bytes, _, _ in batch], durability)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One queue and writer task per org file, created on first write and
+    # dropped again once the writer goes idle
+    app.state.write_queues = {}
+    app.state.writer_tasks = set()
+    # Dedicated pool for file I/O so a slow filesystem can't starve the
+    # default executor (or the event loop)
+    app.state.io_pool = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix="org-io")
+    set_io_executor(app.state.io_pool)
+    yield
+    for task in app.state.writer_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.writer_tasks, return_exceptions=True)
+    set_io_executor(None)
+    app.state.io_pool.shutdown(wait=True)
+    close_cached_fds()
+
+
+def get_write_queue(file_path: str) -> asyncio.Queue:
+    """Get the write queue for a file, starting its writer on first use"""
+    queue = app.state.write_queues.get(file_path)
+    if queue is None:
+        queue = app.state.write_queues[file_path] = asyncio.Queue()
+        app.state.writer_tasks.add(asyncio.create_task(_writer_loop(file_path, queue)))
+    return queue
+
 
 app = FastAPI(
     title="Org-Bridge API",
     description="API server for bridging Emacs org-mode with Zapier",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configuration
@@ -24,8 +120,14 @@ if not API_KEY:
     raise ValueError("ORG_BRIDGE_API_KEY environment variable is required")
 
 INBOX_FILENAME = os.getenv("INBOX_FILENAME", "inbox.org")
+# Resolved once here rather than on every request
+ORG_DIR_PATH = Path(ORG_FILES_DIR)
+INBOX_PATH_STR = get_inbox_file_path(ORG_FILES_DIR, INBOX_FILENAME)
 SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
 SERVER_PORT = int(os.getenv("SERVER_PORT", "8247"))
+# Extra workers are separate processes; heading-based filing rewrites the file,
+# so only raise this if concurrent writes to the same org file are not a concern
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
 
 # Security
 security = HTTPBearer()
@@ -42,6 +144,8 @@ async def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(sec
 
 # Pydantic models
 class TodoItem(BaseModel):
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+    
     id: Optional[str] = None
     title: str
     state: str = "TODO"  # TODO, DONE, etc.
@@ -62,6 +166,8 @@ class TodoItem(BaseModel):
     heading: Optional[str] = None  # Heading under which to file the TODO
 
 class CreateTodoRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+    
     title: str
     state: str = "TODO"
     priority: Optional[str] = None
@@ -79,6 +185,7 @@ class CreateTodoRequest(BaseModel):
     body: Optional[str] = None
     file_name: Optional[str] = None  # Which org file to add to
     heading: Optional[str] = None  # Heading under which to file the TODO
+    durability: Durability = "fast"  # "fast", "fsync" or "atomic"
 
 class NoteRequest(BaseModel):
     title: str
@@ -99,7 +206,7 @@ async def root():
         "message": "Org-Bridge API Server",
         "version": "0.1.0",
         "org_files_dir": ORG_FILES_DIR,
-        "inbox_file": get_inbox_file_path(ORG_FILES_DIR, INBOX_FILENAME),
+        "inbox_file": INBOX_PATH_STR,
         "org_dir_exists": validate_org_directory(ORG_FILES_DIR)
     }
 
@@ -119,7 +226,9 @@ async def health_check(api_key: str = Depends(verify_api_key)):
 #     # TODO: Implement org file parsing
 #     return []
 
-@app.post("/todos", response_model=TodoItem)
+# TodoItem only documents the response; create_todo returns a plain dict of
+# already-validated fields so it isn't validated a second time on the way out
+@app.post("/todos", response_model=None, responses={200: {"model": TodoItem}})
 async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api_key)):
     """
     Create a new TODO item in an org file.
@@ -137,6 +246,7 @@ async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api
     - `heading`: Heading to file under (e.g., "Projects", creates if doesn't exist)
     - `body`: Additional notes/content (e.g., "Need to review Q4 numbers before meeting")
     - `properties`: Key-value pairs (e.g., {"CATEGORY": "work", "EFFORT": "2:00"})
+    - `durability`: How the write is flushed: "fast" (default), "fsync" (forced to disk before responding), or "atomic" (new file renamed into place)
     
     **Recurring TODO fields:**
     - `is_recurring`: Enable recurring pattern (true/false)
@@ -161,10 +271,10 @@ async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api
     try:
         # Determine which file to write to
         if todo.file_name:
-            file_path = str(Path(ORG_FILES_DIR) / todo.file_name)
+            file_path = str(ORG_DIR_PATH / todo.file_name)
         else:
             # Default to inbox file
-            file_path = get_inbox_file_path(ORG_FILES_DIR, INBOX_FILENAME)
+            file_path = INBOX_PATH_STR
         
         # Validate org directory exists
         if not validate_org_directory(ORG_FILES_DIR):
@@ -173,9 +283,7 @@ async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api
                 detail=f"Org files directory not found: {ORG_FILES_DIR}"
             )
         
-        # Append the TODO to the file and get the generated UUID
-        todo_text, generated_uuid = append_todo_to_file(
-            file_path=file_path,
+        todo_fields = dict(
             title=todo.title,
             state=todo.state,
             priority=todo.priority,
@@ -190,34 +298,40 @@ async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api
             repeat_unit=todo.repeat_unit,
             repeat_type=todo.repeat_type,
             properties=todo.properties,
-            body=todo.body,
-            heading=todo.heading
+            body=todo.body
         )
         
+        if todo.heading:
+            # Heading-based filing rewrites the file, so it can't be batched
+            todo_text, generated_uuid = await append_todo_to_file(
+                file_path=file_path,
+                heading=todo.heading,
+                durability=todo.durability,
+                **todo_fields
+            )
+        else:
+            # Plain appends are handed to the file's writer and batched. The
+            # text is encoded here so a TODO that can't be encoded fails
+            # this request alone rather than every TODO in its batch
+            todo_text, generated_uuid = render_todo_text(**todo_fields)
+            todo_bytes = todo_text.encode("utf-8")
+            written = asyncio.get_running_loop().create_future()
+            await get_write_queue(file_path).put((todo_bytes, todo.durability, written))
+            await written
+        
         # Use the generated UUID as the TODO ID
         todo_id = generated_uuid
         
-        return TodoItem(
-            id=todo_id,
-            title=todo.title,
-            state=todo.state,
-            priority=todo.priority,
-            tags=todo.tags,
-            scheduled=todo.scheduled,
-            deadline=todo.deadline,
-            include_scheduled_time=todo.include_scheduled_time,
-            include_deadline_time=todo.include_deadline_time,
-            is_recurring=todo.is_recurring,
-            recurring_field=todo.recurring_field,
-            repeat_every=todo.repeat_every,
-            repeat_unit=todo.repeat_unit,
-            repeat_type=todo.repeat_type,
-            properties=todo.properties,
-            body=todo.body,
-            file_path=file_path,
-            heading=todo.heading
-        )
+        # Echo the request back (minus request-only fields) with the new ID
+        # and resolved path, without building and re-validating a TodoItem
+        return {
+            **todo.model_dump(exclude={"file_name", "durability"}),
+            "id": todo_id,
+            "file_path": file_path
+        }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid TODO: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create TODO: {str(e)}")
 
@@ -266,4 +380,11 @@ async def create_todo(todo: CreateTodoRequest, api_key: str = Depends(verify_api
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT) 
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=SERVER_WORKERS
+    )
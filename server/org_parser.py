@@ -1,13 +1,110 @@
 """
 Org-mode file parsing and manipulation functions.
 """
+import asyncio
+import atexit
+import contextlib
 import os
-import uuid
+import re
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Tuple
+from concurrent.futures import Executor
+from typing import Callable, Iterator, Literal, Optional, List, Set, Tuple
 
+# How hard a write tries to survive a crash: "fast" leaves flushing to the OS,
+# "fsync" forces the data to disk, "atomic" swaps in a complete new file
+Durability = Literal["fast", "fsync", "atomic"]
 
+# Map repeat units to org-mode abbreviations
+_UNIT_MAP = {
+    "hours": "h",
+    "days": "d",
+    "weeks": "w",
+    "months": "m",
+    "years": "y"
+}
+
+# Map repeat types to org-mode prefixes
+_TYPE_MAP = {
+    "standard": "+",
+    "from_completion": ".+",
+    "catch_up": "++"
+}
+
+# Input validation, compiled once at import (org tags may only contain
+# letters, digits, '_', '@', '#' and '%')
+_TAG_RE = re.compile(r"[\w@#%]+")
+_PRIORITY_RE = re.compile(r"[A-Z]")
+_TITLE_BAD_RE = re.compile(r"[\r\n]")
+
+# A heading line in raw file bytes: a run of stars (after any leading
+# whitespace) followed by whitespace or the end of the line. Headings after
+# the first line are found from their leading newline, a literal the regex
+# engine can search for much faster than a ^ anchor
+_HEADING_LINE = rb"[ \t\r\v\f]*(\*+)(?=[ \t]|[ \t\r\v\f]*$)"
+_FIRST_HEADING_RE = re.compile(_HEADING_LINE, re.MULTILINE)
+_NEXT_HEADING_RE = re.compile(rb"\n" + _HEADING_LINE, re.MULTILINE)
+
+# ISO timestamps _slice_iso_timestamp can slice: a date, optionally followed
+# by a time with optional seconds and UTC offset; anything else is parsed
+_ISO_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d)?(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?)?",
+    re.ASCII
+)
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Trailing tag block of a heading, e.g. the " :work:urgent:" in "* Foo :work:urgent:"
+_HEADING_TAGS_RE = re.compile(r"\s+(?::[\w@#%]+)+:\s*$")
+
+# How long (in seconds) validate_org_directory trusts its last answer
+ORG_DIR_CHECK_INTERVAL = 60
+
+# One lock per org file so concurrent requests can't interleave a
+# read-modify-write of the same file now that file I/O yields to the event loop.
+# Held weakly: a lock goes away once no request holds or waits on it, so the
+# table doesn't grow with every file name a client ever sent
+_FILE_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Executor that blocking file I/O runs on (None means asyncio's default pool)
+_IO_EXECUTOR: Optional[Executor] = None
+
+# Directories already created (or found to exist) by this process
+_ENSURED_DIRS: Set[str] = set()
+
+# Fixed separators of appended output, encoded once at import; only the
+# TODO text itself is encoded per write
+_NEWLINE = b"\n"
+_BLANK_LINE = b"\n\n"
+_NO_SPACING = b""
+
+# Gather writes: os.writev takes at most IOV_MAX buffers per call
+_HAS_WRITEV = hasattr(os, "writev")
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+# Append-mode descriptors kept open between writes, keyed by path, along with
+# the (st_dev, st_ino) of the file they were opened on. File names come from
+# clients, so only the FD_CACHE_SIZE most recently used stay open
+FD_CACHE_SIZE = 32
+_FD_CACHE: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+# Paths whose descriptor is being written through right now (never evicted),
+# and the lock guarding both, since I/O runs on several threads
+_FD_IN_USE: Set[str] = set()
+_FD_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=64)
 def build_repeat_suffix(repeat_every: int, repeat_unit: str, repeat_type: str) -> str:
     """
     Build org-mode repeat suffix from components.
@@ -20,28 +117,43 @@ def build_repeat_suffix(repeat_every: int, repeat_unit: str, repeat_type: str) -
     Returns:
         Org-mode repeat suffix like '+1w', '.+2d', '++3m'
     """
-    # Map units to org-mode abbreviations
-    unit_map = {
-        "hours": "h",
-        "days": "d",
-        "weeks": "w", 
-        "months": "m",
-        "years": "y"
-    }
+    return f"{_TYPE_MAP.get(repeat_type, '+')}{repeat_every}{_UNIT_MAP.get(repeat_unit, 'd')}"
+
+
+def _slice_iso_timestamp(iso_datetime_str: str, include_time: bool) -> Optional[str]:
+    """
+    Fast path for format_org_timestamp on well-formed ISO strings.
+    
+    The org date (and time) are just the leading characters of an ISO string,
+    so they can be sliced out without building a datetime. Only strings that
+    fromisoformat would accept are sliced.
+    
+    Returns:
+        'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM', or None if the string doesn't
+        have that shape and needs a full parse
+    """
+    s = iso_datetime_str
+    if not _ISO_TIMESTAMP_RE.fullmatch(s):
+        return None
+    
+    # The regex checks the shape; the date itself must exist too
+    year, month, day = int(s[:4]), int(s[5:7]), int(s[8:10])
+    if not (year and 1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month - 1]):
+        return None
+    if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        return None
     
-    # Map types to org-mode prefixes
-    type_map = {
-        "standard": "+",
-        "from_completion": ".+",
-        "catch_up": "++"
-    }
+    if not include_time:
+        return s[:10]
     
-    unit_abbrev = unit_map.get(repeat_unit, "d")
-    type_prefix = type_map.get(repeat_type, "+")
+    if len(s) == 10:
+        # Date-only input parses as midnight
+        return f"{s} 00:00"
     
-    return f"{type_prefix}{repeat_every}{unit_abbrev}"
+    return f"{s[:10]} {s[11:16]}"
 
 
+@lru_cache(maxsize=4096)
 def format_org_timestamp(
     iso_datetime_str: str, 
     include_time: bool = False,
@@ -63,14 +175,19 @@ def format_org_timestamp(
     Returns:
         Org-mode timestamp string like '<2025-01-20>' or '<2025-01-20 14:30 +1w>'
     """
-    # Parse ISO string but ignore timezone
-    dt = datetime.fromisoformat(iso_datetime_str.replace('Z', '+00:00'))
+    timestamp = _slice_iso_timestamp(iso_datetime_str, include_time)
     
-    # Build base timestamp
-    if include_time:
-        timestamp = f"{dt.strftime('%Y-%m-%d %H:%M')}"
-    else:
-        timestamp = f"{dt.strftime('%Y-%m-%d')}"
+    if timestamp is None:
+        # Parse ISO string but ignore timezone ('Z' can only be the last character)
+        if iso_datetime_str.endswith('Z'):
+            iso_datetime_str = iso_datetime_str[:-1] + '+00:00'
+        dt = datetime.fromisoformat(iso_datetime_str)
+        
+        # Build base timestamp
+        if include_time:
+            timestamp = f"{dt.strftime('%Y-%m-%d %H:%M')}"
+        else:
+            timestamp = f"{dt.strftime('%Y-%m-%d')}"
     
     # Add repeat suffix if recurring
     if repeat_every and repeat_unit and repeat_type:
@@ -80,66 +197,124 @@ def format_org_timestamp(
     return f"<{timestamp}>"
 
 
-def find_heading_insertion_point(lines: List[str], target_heading: str) -> Optional[Tuple[int, int]]:
+def find_heading_insertion_point(buf: bytes, target_heading: str) -> Optional[Tuple[int, int, bool]]:
     """
     Find the insertion point for a TODO under a specific heading.
     
+    Only heading lines are visited: _heading_lines skips over body text
+    inside the regex engine, so the per-line Python work is limited to the
+    file's headings.
+    
     Args:
-        lines: List of file lines
+        buf: Contents of the org file (bytes or another bytes-like buffer)
         target_heading: The heading text to search for (without the * prefix)
     
     Returns:
-        Tuple of (line index where TODO should be inserted, heading level) or None if heading not found
+        Tuple of (byte offset where TODO should be inserted, heading level,
+        whether the line before that offset is blank) or None if heading not found
     """
     target_heading = target_heading.strip()
-    
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        # Check if this line is a heading that matches our target
-        if line.startswith('*') and line.count('*') >= 1:
+    heading_level = None
+    
+    # A heading can only match if its raw bytes contain the target, which
+    # rules out most headings without decoding them ('\ufffd' can come from
+    # undecodable bytes, so it disables the check)
+    target_bytes = b"" if "\ufffd" in target_heading else target_heading.encode("utf-8")
+    
+    for line_start, level, text_start in _heading_lines(buf):
+        if heading_level is None:
+            line_end = buf.find(b"\n", text_start)
+            if line_end == -1:
+                line_end = len(buf)
+            if buf.find(target_bytes, text_start, line_end) == -1:
+                continue
+            
             # Extract heading text (remove * and any tags)
-            heading_text = line.lstrip('*').strip()
+            heading_text = buf[text_start:line_end].decode("utf-8", errors="replace").strip()
             
-            # Remove tags if present (anything after the last space that contains :)
-            if ':' in heading_text and heading_text.endswith(':'):
-                # Find the last space before tags
-                words = heading_text.split()
-                for j in range(len(words) - 1, -1, -1):
-                    if ':' not in words[j]:
-                        heading_text = ' '.join(words[:j+1])
-                        break
-                else:
-                    # All words contain :, so it's just tags
-                    continue
+            # Remove trailing tags if present
+            if heading_text.endswith(':'):
+                heading_text = _HEADING_TAGS_RE.sub('', heading_text)
             
             # Check if this heading matches our target
             if heading_text == target_heading:
-                # Found the heading! Now find where to insert the TODO
-                heading_level = line.count('*')
-                
-                # Look for the end of this heading's content
-                # We want to insert before any subheading or next heading of same/higher level
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    
-                    # If we find another heading, check its level
-                    if next_line.startswith('*'):
-                        next_heading_level = next_line.count('*')
-                        
-                        # If it's same level or higher (fewer *), insert before it
-                        if next_heading_level <= heading_level:
-                            return j, heading_level
-                
-                # If we reach here, insert at the end of the file
-                return len(lines), heading_level
+                heading_level = level
+        
+        # Look for the end of this heading's content: insert before the next
+        # heading of the same or a higher level (fewer *)
+        elif level <= heading_level:
+            return line_start, heading_level, _line_before_is_blank(buf, line_start)
+    
+    if heading_level is not None:
+        # Subtree runs to the end of the file, insert there
+        return len(buf), heading_level, _line_before_is_blank(buf, len(buf))
     
     # Heading not found
     return None
 
 
-def append_todo_to_file(
-    file_path: str,
+def _heading_lines(buf: bytes) -> Iterator[Tuple[int, int, int]]:
+    """Yield (line offset, level, offset of the text after the stars) for each heading line."""
+    match = _FIRST_HEADING_RE.match(buf)
+    if match:
+        yield 0, match.end(1) - match.start(1), match.end()
+    for match in _NEXT_HEADING_RE.finditer(buf):
+        yield match.start() + 1, match.end(1) - match.start(1), match.end()
+
+
+def _line_before_is_blank(buf: bytes, offset: int) -> bool:
+    """Whether the line ending at offset (a line start or the end of buf) is blank."""
+    line_start = buf.rfind(b"\n", 0, offset - 1) + 1
+    return not buf[line_start:offset].strip()
+
+
+def _new_org_id() -> str:
+    """
+    Generate an uppercase random (version 4) UUID for an entry's :ID: property.
+    
+    Same format as str(uuid.uuid4()).upper(), built from the raw bytes to skip
+    the UUID object and the extra lowercase string.
+    
+    Returns:
+        UUID string like '6F1C2A4E-9B0D-4C1E-8A52-3D7E9F0B1C2D'
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    hx = raw.hex().upper()
+    return f"{hx[:8]}-{hx[8:12]}-{hx[12:16]}-{hx[16:20]}-{hx[20:]}"
+
+
+@lru_cache(maxsize=1024)
+def _tag_suffix(tags: Tuple[str, ...]) -> str:
+    """
+    Headline tag suffix like ' :work:urgent:', or '' when there are no tags.
+    
+    Tag sets recur, so results are cached.
+    """
+    return f" :{':'.join(tags)}:" if tags else ""
+
+
+def _render_bare_todo(title: str, state: str) -> Tuple[str, str]:
+    """
+    Render a TODO that has only a title and state, the most common shape.
+    
+    The output shape is known up front, so this skips the timestamp and
+    fragment machinery of render_todo_text.
+    
+    Returns:
+        Tuple of (rendered TODO text, generated UUID)
+    
+    Raises:
+        ValueError: If the title isn't a single line
+    """
+    if _TITLE_BAD_RE.search(title):
+        raise ValueError("Title must be a single line")
+    generated_uuid = _new_org_id()
+    return f"* {state} {title}\n:PROPERTIES:\n:ID: {generated_uuid}\n:END:", generated_uuid
+
+
+def render_todo_text(
     title: str,
     state: str = "TODO",
     priority: Optional[str] = None,
@@ -154,55 +329,48 @@ def append_todo_to_file(
     repeat_unit: Optional[str] = None,
     repeat_type: Optional[str] = None,
     properties: Optional[dict] = None,
-    body: Optional[str] = None,
-    heading: Optional[str] = None
-):
+    body: Optional[str] = None
+) -> Tuple[str, str]:
     """
-    Append a TODO item to an org file.
+    Render a TODO item as a top-level org entry without touching any file.
     
     Args:
-        file_path: Path to the org file
-        title: TODO title/description
-        state: TODO state (TODO, DONE, etc.)
-        priority: Priority level (A, B, C)
-        tags: List of tags
-        scheduled: Scheduled date (ISO datetime string)
-        deadline: Deadline date (ISO datetime string)
-        include_scheduled_time: Whether to include time in scheduled timestamp
-        include_deadline_time: Whether to include time in deadline timestamp
-        is_recurring: Whether this TODO is recurring
-        recurring_field: Which field to make recurring ("scheduled" or "deadline")
-        repeat_every: Number for recurring pattern
-        repeat_unit: Unit for recurring pattern ("hours", "days", "weeks", "months", "years")
-        repeat_type: Type for recurring pattern ("standard", "from_completion", "catch_up")
-        properties: Dict of properties for properties drawer
-        body: Additional content/notes for the TODO
-        heading: The heading under which the TODO should be filed
+        Same as append_todo_to_file, minus file_path and heading
     
     Returns:
-        Tuple of (TODO item text that was appended, generated UUID)
+        Tuple of (rendered TODO text, generated UUID)
+    
+    Raises:
+        ValueError: If the title, priority or a tag can't be written as-is
     """
-    tags = tags or []
+    # Skip empty tags, e.g. from a trailing comma in a client's tag list
+    tags = [tag for tag in tags if tag.strip()] if tags else []
+    
+    # Fast path for the common bare TODO (title and state only)
+    if not (priority or tags or scheduled or deadline or properties or body):
+        return _render_bare_todo(title, state)
+    
+    # Reject input that would corrupt the org structure
+    if _TITLE_BAD_RE.search(title):
+        raise ValueError("Title must be a single line")
+    if priority and not _PRIORITY_RE.fullmatch(priority):
+        raise ValueError(f"Invalid priority: {priority!r} (expected a single letter A-Z)")
+    for tag in tags:
+        if not _TAG_RE.fullmatch(tag):
+            raise ValueError(f"Invalid tag: {tag!r} (only letters, digits, '_', '@', '#' and '%' are allowed)")
     
-    # Build the TODO line
-    todo_parts = [f"* {state}"]
+    # Collect every fragment of the entry and join them once at the end
+    parts = ["* ", state]
     
     # Add priority
     if priority:
-        todo_parts.append(f"[#{priority}]")
+        parts += (" [#", priority, "]")
     
     # Add title
-    todo_parts.append(title)
+    parts += (" ", title)
     
     # Add tags
-    if tags:
-        tag_string = ":" + ":".join(tags) + ":"
-        todo_parts.append(tag_string)
-    
-    todo_line = " ".join(todo_parts)
-    
-    # Add scheduling/deadline info
-    additional_lines = []
+    parts.append(_tag_suffix(tuple(tags)))
     
     # Format timestamps
     scheduled_timestamp = None
@@ -212,207 +380,510 @@ def append_todo_to_file(
     add_recurring_to_scheduled = is_recurring and recurring_field == "scheduled"
     add_recurring_to_deadline = is_recurring and recurring_field == "deadline"
     
-    if scheduled:
-        if add_recurring_to_scheduled:
-            scheduled_timestamp = format_org_timestamp(
-                scheduled, include_scheduled_time, 
-                repeat_every, repeat_unit, repeat_type
-            )
-        else:
-            scheduled_timestamp = format_org_timestamp(scheduled, include_scheduled_time)
-    
-    if deadline:
-        if add_recurring_to_deadline:
-            deadline_timestamp = format_org_timestamp(
-                deadline, include_deadline_time,
-                repeat_every, repeat_unit, repeat_type
-            )
-        else:
-            deadline_timestamp = format_org_timestamp(deadline, include_deadline_time)
+    if (
+        scheduled and scheduled == deadline
+        and include_scheduled_time == include_deadline_time
+        and add_recurring_to_scheduled == add_recurring_to_deadline
+    ):
+        # Same-day task: both timestamps render identically, so format once
+        scheduled_timestamp = deadline_timestamp = format_org_timestamp(scheduled, include_scheduled_time)
+    else:
+        if scheduled:
+            if add_recurring_to_scheduled:
+                scheduled_timestamp = format_org_timestamp(
+                    scheduled, include_scheduled_time, 
+                    repeat_every, repeat_unit, repeat_type
+                )
+            else:
+                scheduled_timestamp = format_org_timestamp(scheduled, include_scheduled_time)
+        
+        if deadline:
+            if add_recurring_to_deadline:
+                deadline_timestamp = format_org_timestamp(
+                    deadline, include_deadline_time,
+                    repeat_every, repeat_unit, repeat_type
+                )
+            else:
+                deadline_timestamp = format_org_timestamp(deadline, include_deadline_time)
     
     # If both scheduled and deadline exist, put them on the same line
     if scheduled_timestamp and deadline_timestamp:
-        additional_lines.append(f"SCHEDULED: {scheduled_timestamp} DEADLINE: {deadline_timestamp}")
+        parts += ("\nSCHEDULED: ", scheduled_timestamp, " DEADLINE: ", deadline_timestamp)
     elif scheduled_timestamp:
-        additional_lines.append(f"SCHEDULED: {scheduled_timestamp}")
+        parts += ("\nSCHEDULED: ", scheduled_timestamp)
     elif deadline_timestamp:
-        additional_lines.append(f"DEADLINE: {deadline_timestamp}")
+        parts += ("\nDEADLINE: ", deadline_timestamp)
     
-    # Always add properties drawer with generated ID
+    # Always add properties drawer with generated ID (following org-id convention)
+    generated_uuid = _new_org_id()
     if not properties:
-        properties = {}
+        parts.append(f"\n:PROPERTIES:\n:ID: {generated_uuid}\n:END:")
+    else:
+        properties["ID"] = generated_uuid
+        
+        # Ensure property keys are uppercase (org-mode convention). The dict is
+        # only rebuilt when a key needs it, so keys that collide once
+        # uppercased still collapse into one entry
+        if not all(k.isupper() for k in properties):
+            properties = {k.upper(): v for k, v in properties.items()}
+        
+        parts.append("\n:PROPERTIES:")
+        parts.extend(f"\n:{prop_name}: {prop_value}" for prop_name, prop_value in properties.items())
+        parts.append("\n:END:")
     
-    # Generate UUID for this TODO (following org-id convention)
-    generated_uuid = str(uuid.uuid4()).upper()
-    properties["ID"] = generated_uuid
+    # Add body if provided (separated by blank line)
+    if body:
+        parts += ("\n\n", body.strip())
     
-    # Ensure property keys are uppercase (org-mode convention)
-    uppercased_properties = {k.upper(): v for k, v in properties.items()}
+    return "".join(parts), generated_uuid
+
+
+def _file_lock(path: str) -> asyncio.Lock:
+    """Get the lock serializing writes to a file, creating it if needed."""
+    lock = _FILE_LOCKS.get(path)
+    if lock is None:
+        lock = _FILE_LOCKS[path] = asyncio.Lock()
+    return lock
+
+
+def set_io_executor(executor: Optional[Executor]) -> None:
+    """
+    Set the executor that blocking file I/O is run on.
     
-    additional_lines.append(":PROPERTIES:")
-    for prop_name, prop_value in uppercased_properties.items():
-        additional_lines.append(f":{prop_name}: {prop_value}")
-    additional_lines.append(":END:")
+    Args:
+        executor: A dedicated pool (e.g. a ThreadPoolExecutor owned by the
+            app), or None to fall back to asyncio's default executor
+    """
+    global _IO_EXECUTOR
+    _IO_EXECUTOR = executor
+
+
+async def _run_io(func: Callable, *args):
+    """Run a blocking file I/O function on the I/O executor."""
+    return await asyncio.get_running_loop().run_in_executor(_IO_EXECUTOR, func, *args)
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create a file's parent directory, once per directory per process."""
+    parent = os.path.dirname(path)
+    if parent and parent not in _ENSURED_DIRS:
+        os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
+
+
+@contextlib.contextmanager
+def _append_fd(path: str) -> Iterator[Tuple[int, int]]:
+    """
+    Borrow a cached O_APPEND descriptor for a file, opening it if needed.
     
-    # Combine everything
-    todo_text = todo_line
-    if additional_lines:
-        todo_text += "\n" + "\n".join(additional_lines)
+    The descriptor is reopened when the path no longer points at the file it
+    was opened on, e.g. after an editor saved the file by renaming over it.
+    It stays open after the block, unless FD_CACHE_SIZE other files have been
+    written since.
     
-    # Add body if provided (separated by blank line)
-    if body:
-        todo_text += "\n\n" + body.strip()
+    Args:
+        path: Path to the file
     
-    # Prepare file path
-    file_path_obj = Path(file_path)
+    Yields:
+        Tuple of (file descriptor, current file size)
+    """
+    with _FD_CACHE_LOCK:
+        fd, size = _open_append_fd(path)
+        _FD_IN_USE.add(path)
+    try:
+        yield fd, size
+    finally:
+        with _FD_CACHE_LOCK:
+            _FD_IN_USE.discard(path)
+            _evict_append_fds()
+
+
+def _open_append_fd(path: str) -> Tuple[int, int]:
+    """Look up or open the cached descriptor for a path (caller holds _FD_CACHE_LOCK)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    
+    cached = _FD_CACHE.get(path)
+    if cached is not None:
+        fd, st_dev, st_ino = cached
+        if st is not None and (st.st_dev, st.st_ino) == (st_dev, st_ino):
+            _FD_CACHE.move_to_end(path)
+            return fd, st.st_size
+        del _FD_CACHE[path]
+        os.close(fd)
+    
+    # O_RDWR rather than O_WRONLY so the tail can be read back for spacing
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    st = os.fstat(fd)
+    _FD_CACHE[path] = (fd, st.st_dev, st.st_ino)
+    return fd, st.st_size
+
+
+def _evict_append_fds() -> None:
+    """Close the least recently used descriptors beyond FD_CACHE_SIZE (caller holds _FD_CACHE_LOCK)."""
+    excess = len(_FD_CACHE) - FD_CACHE_SIZE
+    if excess <= 0:
+        return
+    for path in [p for p in _FD_CACHE if p not in _FD_IN_USE][:excess]:
+        fd, _, _ = _FD_CACHE.pop(path)
+        os.close(fd)
+
+
+def close_cached_fds() -> None:
+    """Close every descriptor held open by the append path."""
+    with _FD_CACHE_LOCK:
+        while _FD_CACHE:
+            _, (fd, _, _) = _FD_CACHE.popitem()
+            os.close(fd)
+
+
+atexit.register(close_cached_fds)
+
+
+def _replace_file(path: str, content: bytes) -> None:
+    """
+    Atomically replace a file's contents.
     
+    The content goes to a temp file in the same directory, is fsynced, and is
+    then renamed over the original, so readers see either the old or the new
+    file and never a partial write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Keep the original file's permissions (mkstemp creates it as 0600)
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _write_chunks(fd: int, chunks: List[bytes]) -> None:
+    """
+    Write byte chunks to a descriptor, with one gather write (writev) when the
+    platform has it, so the chunks are never concatenated in Python.
+    """
+    if _HAS_WRITEV and len(chunks) <= _IOV_MAX:
+        written = os.writev(fd, chunks)
+        if written == sum(map(len, chunks)):
+            return
+        # Short write: finish the remainder the slow way
+        data = b"".join(chunks)[written:]
+    else:
+        data = b"".join(chunks)
+    
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _write_to_append_fd(path: str, fd: int, size: int, chunks: List[bytes], durability: Durability) -> None:
+    """Append chunks through a descriptor from _append_fd with the requested durability."""
+    if durability == "atomic":
+        _replace_file(path, b"".join((os.pread(fd, size, 0), *chunks)))
+        return
+    
+    _write_chunks(fd, chunks)
+    if durability == "fsync":
+        os.fsync(fd)
+
+
+def _append_raw(path: str, content: bytes, durability: Durability = "fast") -> None:
+    """Append content to a file as-is."""
+    with _append_fd(path) as (fd, size):
+        _write_to_append_fd(path, fd, size, [content], durability)
+
+
+def _append_with_spacing(path: str, chunks: List[bytes], durability: Durability = "fast") -> None:
+    """
+    Append encoded chunks to a file, leaving exactly one blank line before them.
+    
+    Only the last two bytes of the file are read to decide the spacing.
+    """
     # Create directory if it doesn't exist
-    file_path_obj.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Handle heading-based filing vs. simple append
-    if heading:
-        # Read the entire file to find the heading
-        if file_path_obj.exists():
-            with open(file_path_obj, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-        else:
-            lines = []
+    _ensure_parent_dir(path)
+    
+    with _append_fd(path) as (fd, size):
+        if size:
+            tail = os.pread(fd, 2, max(size - 2, 0))
+            # Check if file already ends with newline(s)
+            if tail.endswith(_BLANK_LINE):
+                # Already has blank line at end, just add content
+                prefix = _NO_SPACING
+            elif tail.endswith(_NEWLINE):
+                # Ends with single newline, add blank line then content
+                prefix = _NEWLINE
+            else:
+                # Doesn't end with newline, add newline + blank line + content
+                prefix = _BLANK_LINE
+            
+            chunks = [prefix, *chunks]
         
-        # Find the target heading and insertion point
-        result = find_heading_insertion_point(lines, heading)
+        _write_to_append_fd(path, fd, size, chunks, durability)
+
+
+async def append_todo_texts(
+    file_path: str,
+    todo_texts: List[bytes],
+    durability: Durability = "fast"
+) -> None:
+    """
+    Append already-rendered, already-encoded TODO items to the end of an org file.
+    
+    All items are written with a single write on a cached append-mode
+    descriptor, separated by one blank line, and the file's trailing newlines
+    decide the leading spacing so there is exactly one blank line before the
+    first item.
+    
+    Args:
+        file_path: Path to the org file
+        todo_texts: Rendered TODO items (as returned by render_todo_text),
+            UTF-8 encoded by the caller, so an item that can't be encoded
+            fails on its own instead of failing the whole batch
+        durability: "fast", "fsync" or "atomic" (see Durability); applies to
+            the whole batch, so many items can share a single fsync
+    """
+    if not todo_texts:
+        return
+    
+    # Separators are pre-encoded constants
+    chunks = []
+    for todo_bytes in todo_texts:
+        chunks += (todo_bytes, _BLANK_LINE)
+    chunks[-1] = _NEWLINE
+    
+    path = os.fspath(file_path)
+    async with _file_lock(path):
+        await _run_io(_append_with_spacing, path, chunks, durability)
+
+
+def _insert_under_heading(path: str, heading: str, todo_bytes: bytes, durability: Durability = "fast") -> None:
+    """
+    File a rendered TODO under a heading, creating the heading if needed.
+    
+    Only the part of the file after the insertion point is rewritten.
+    
+    Args:
+        path: Path to the org file
+        heading: The heading text to file under (without the * prefix)
+        todo_bytes: Rendered TODO item (as returned by render_todo_text), UTF-8 encoded
+        durability: "fast", "fsync" or "atomic" (see Durability)
+    """
+    # Create directory if it doesn't exist
+    _ensure_parent_dir(path)
+    
+    # A missing file is created empty (and so has no headings)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        # Read the whole file in one call. It isn't mmapped: the user's editor
+        # may truncate and rewrite it in place at any moment, and touching a
+        # mapping past the new end of file kills the process with SIGBUS
+        data = os.pread(fd, os.fstat(fd).st_size, 0)
+        result = find_heading_insertion_point(data, heading)
         
         if result is not None:
-            insertion_point, heading_level = result
+            offset, heading_level, prev_blank = result
             
             # Create TODO at one level deeper than the parent heading
-            todo_level = "*" * (heading_level + 1)
+            # (the rendered text starts with a single "*"), with exactly one
+            # blank line before it and one after (the insertion point is
+            # always a heading or the end of the file)
+            block = b"".join((
+                _NO_SPACING if prev_blank else _NEWLINE,
+                b"*" * heading_level, todo_bytes, _NEWLINE,
+                _NEWLINE
+            ))
             
-            # Rebuild TODO with correct level
-            todo_parts = [f"{todo_level} {state}"]
+            # Everything from the insertion point on moves down by the block
+            # (sliced through a memoryview, so the tail isn't copied)
+            tail = memoryview(data)[offset:]
             
-            # Add priority
-            if priority:
-                todo_parts.append(f"[#{priority}]")
-            
-            # Add title
-            todo_parts.append(title)
-            
-            # Add tags
-            if tags:
-                tag_string = ":" + ":".join(tags) + ":"
-                todo_parts.append(tag_string)
-            
-            corrected_todo_line = " ".join(todo_parts)
-            
-            # Rebuild the complete TODO text with correct heading level
-            corrected_todo_text = corrected_todo_line
-            if additional_lines:
-                corrected_todo_text += "\n" + "\n".join(additional_lines)
-            
-            # Add body if provided (separated by blank line)
-            if body:
-                corrected_todo_text += "\n\n" + body.strip()
-            
-            # Insert the TODO under the found heading with proper spacing
-            todo_lines = corrected_todo_text.split('\n')
-            
-            # Handle proper spacing - ensure exactly one blank line before and after TODO
-            
-            # Check if we need a blank line before the TODO
-            need_blank_before = True
-            if insertion_point > 0:
-                prev_line = lines[insertion_point - 1].strip()
-                if prev_line == '':
-                    need_blank_before = False
-            
-            # Check if we need a blank line after the TODO  
-            need_blank_after = True
-            if insertion_point < len(lines):
-                next_line = lines[insertion_point].strip()
-                if next_line == '':
-                    need_blank_after = False
-            
-            # Insert the TODO with proper spacing
-            offset = 0
-            
-            # Add blank line before if needed
-            if need_blank_before:
-                lines.insert(insertion_point + offset, '\n')
-                offset += 1
-            
-            # Insert the TODO lines
-            for i, line in enumerate(todo_lines):
-                lines.insert(insertion_point + offset + i, line + '\n')
-            offset += len(todo_lines)
-            
-            # Add blank line after if needed
-            if need_blank_after:
-                lines.insert(insertion_point + offset, '\n')
-            
-            # Write the modified content back to file
-            with open(file_path_obj, "w", encoding="utf-8") as f:
-                f.writelines(lines)
-        else:
-            # Heading not found, create it and add the TODO under it (TODO as level 2)
-            heading_text = f"* {heading}\n\n** {state}"
-            
-            # Add priority to the TODO
-            if priority:
-                heading_text += f" [#{priority}]"
-            
-            # Add title
-            heading_text += f" {title}"
-            
-            # Add tags
-            if tags:
-                tag_string = ":" + ":".join(tags) + ":"
-                heading_text += f" {tag_string}"
-            
-            # Add the rest of the TODO content
-            if additional_lines:
-                heading_text += "\n" + "\n".join(additional_lines)
-            
-            # Add body if provided
-            if body:
-                heading_text += "\n\n" + body.strip()
-            
-            # Append the new heading and TODO to file
-            with open(file_path_obj, "a", encoding="utf-8") as f:
-                f.write(f"\n{heading_text}\n")
-    else:
-        # No heading specified, append to end of file (original behavior)
-        # Use smart spacing logic similar to heading insertion
-        if file_path_obj.exists():
-            with open(file_path_obj, "r", encoding="utf-8") as f:
-                existing_content = f.read()
-            
-            # Check if file ends with content or blank lines
-            if existing_content.strip():  # File has content
-                # Check if file already ends with newline(s)
-                if existing_content.endswith('\n\n'):
-                    # Already has blank line at end, just add TODO
-                    with open(file_path_obj, "a", encoding="utf-8") as f:
-                        f.write(f"{todo_text}\n")
-                elif existing_content.endswith('\n'):
-                    # Ends with single newline, add blank line then TODO
-                    with open(file_path_obj, "a", encoding="utf-8") as f:
-                        f.write(f"\n{todo_text}\n")
-                else:
-                    # Doesn't end with newline, add newline + blank line + TODO
-                    with open(file_path_obj, "a", encoding="utf-8") as f:
-                        f.write(f"\n\n{todo_text}\n")
+            if durability == "atomic":
+                _replace_file(path, b"".join((data[:offset], block, tail)))
             else:
-                # Empty file, just add TODO
-                with open(file_path_obj, "w", encoding="utf-8") as f:
-                    f.write(f"{todo_text}\n")
-        else:
-            # File doesn't exist, create it with TODO
-            with open(file_path_obj, "w", encoding="utf-8") as f:
-                f.write(f"{todo_text}\n")
+                # Write straight to the descriptor: block and tail go out in
+                # one gather write
+                os.lseek(fd, offset, os.SEEK_SET)
+                _write_chunks(fd, [block, tail])
+                if durability == "fsync":
+                    os.fsync(fd)
+            return
+    finally:
+        os.close(fd)
+    
+    # Heading not found, append it with the TODO under it (TODO as level 2),
+    # built as a single buffer
+    _append_raw(path, b"".join((f"\n* {heading}\n\n*".encode("utf-8"), todo_bytes, _NEWLINE)), durability)
+
+
+async def _write_todo_text(
+    path: str,
+    todo_bytes: bytes,
+    heading: Optional[str] = None,
+    durability: Durability = "fast"
+) -> None:
+    """
+    Write one rendered TODO: filed under heading if given, else appended.
+    
+    Args:
+        path: Path to the org file
+        todo_bytes: Rendered TODO item (as returned by render_todo_text), UTF-8 encoded
+        heading: The heading under which the TODO should be filed
+        durability: "fast", "fsync" or "atomic" (see Durability)
+    """
+    if not heading:
+        # No heading specified, append to end of file (original behavior)
+        await append_todo_texts(path, [todo_bytes], durability)
+        return
+    
+    async with _file_lock(path):
+        await _run_io(_insert_under_heading, path, heading, todo_bytes, durability)
+
+
+async def append_todo_to_file(
+    file_path: str,
+    title: str,
+    state: str = "TODO",
+    priority: Optional[str] = None,
+    tags: List[str] = None,
+    scheduled: Optional[str] = None,
+    deadline: Optional[str] = None,
+    include_scheduled_time: bool = False,
+    include_deadline_time: bool = False,
+    is_recurring: bool = False,
+    recurring_field: Optional[str] = None,
+    repeat_every: Optional[int] = None,
+    repeat_unit: Optional[str] = None,
+    repeat_type: Optional[str] = None,
+    properties: Optional[dict] = None,
+    body: Optional[str] = None,
+    heading: Optional[str] = None,
+    durability: Durability = "fast"
+):
+    """
+    Append a TODO item to an org file.
+    
+    Args:
+        file_path: Path to the org file
+        title: TODO title/description
+        state: TODO state (TODO, DONE, etc.)
+        priority: Priority level (A, B, C)
+        tags: List of tags
+        scheduled: Scheduled date (ISO datetime string)
+        deadline: Deadline date (ISO datetime string)
+        include_scheduled_time: Whether to include time in scheduled timestamp
+        include_deadline_time: Whether to include time in deadline timestamp
+        is_recurring: Whether this TODO is recurring
+        recurring_field: Which field to make recurring ("scheduled" or "deadline")
+        repeat_every: Number for recurring pattern
+        repeat_unit: Unit for recurring pattern ("hours", "days", "weeks", "months", "years")
+        repeat_type: Type for recurring pattern ("standard", "from_completion", "catch_up")
+        properties: Dict of properties for properties drawer
+        body: Additional content/notes for the TODO
+        heading: The heading under which the TODO should be filed
+        durability: "fast" (default), "fsync" to force the write to disk, or
+            "atomic" to write a new file and rename it into place
+    
+    Returns:
+        Tuple of (TODO item text that was appended, generated UUID)
+    """
+    # Fast path for a bare TODO appended to the end of the file: no generic
+    # rendering and no writer dispatch
+    if not (priority or tags or scheduled or deadline or properties or body or heading):
+        todo_text, generated_uuid = _render_bare_todo(title, state)
+        await append_todo_texts(os.fspath(file_path), [todo_text.encode("utf-8")], durability)
+        return todo_text, generated_uuid
+    
+    todo_text, generated_uuid = render_todo_text(
+        title=title,
+        state=state,
+        priority=priority,
+        tags=tags,
+        scheduled=scheduled,
+        deadline=deadline,
+        include_scheduled_time=include_scheduled_time,
+        include_deadline_time=include_deadline_time,
+        is_recurring=is_recurring,
+        recurring_field=recurring_field,
+        repeat_every=repeat_every,
+        repeat_unit=repeat_unit,
+        repeat_type=repeat_type,
+        properties=properties,
+        body=body
+    )
+    
+    await _write_todo_text(os.fspath(file_path), todo_text.encode("utf-8"), heading, durability)
     
     return todo_text, generated_uuid
 
 
+async def append_todos_to_file(
+    file_path: str,
+    todos: List[dict],
+    durability: Durability = "fast"
+) -> List[Tuple[str, str]]:
+    """
+    Append several TODO items to an org file in one go.
+    
+    Every item is rendered and encoded (and so validated) before anything
+    is written.
+    Consecutive items without a heading are then appended with a single
+    write, and items with a heading are filed one at a time, so the file ends
+    up the same as after calling append_todo_to_file for each item in order.
+    
+    Args:
+        file_path: Path to the org file
+        todos: Keyword arguments for append_todo_to_file, one dict per item
+            (without file_path and durability)
+        durability: "fast", "fsync" or "atomic" (see Durability), applied to
+            every write of the batch
+    
+    Returns:
+        List of (TODO item text, generated UUID) tuples, in the order given
+    
+    Raises:
+        ValueError: If any item can't be written as-is (nothing is written)
+    """
+    path = os.fspath(file_path)
+    
+    rendered = []
+    for todo in todos:
+        fields = {k: v for k, v in todo.items() if k != "heading"}
+        todo_text, generated_uuid = render_todo_text(**fields)
+        heading = todo.get("heading")
+        if heading:
+            # The heading is only encoded mid-write, so check it here too
+            heading.encode("utf-8")
+        rendered.append((heading, todo_text, todo_text.encode("utf-8"), generated_uuid))
+    
+    # Items without a heading are collected until the next heading item
+    pending = []
+    for heading, _, todo_bytes, _ in rendered:
+        if not heading:
+            pending.append(todo_bytes)
+            continue
+        
+        await append_todo_texts(path, pending, durability)
+        pending = []
+        await _write_todo_text(path, todo_bytes, heading, durability)
+    
+    await append_todo_texts(path, pending, durability)
+    
+    return [(todo_text, generated_uuid) for _, todo_text, _, generated_uuid in rendered]
+
+
+@lru_cache(maxsize=32)
 def get_inbox_file_path(org_dir: str, inbox_filename: str = "inbox.org") -> str:
     """
     Get the path to the inbox file.
@@ -437,4 +908,10 @@ def validate_org_directory(org_dir: str) -> bool:
     Returns:
         True if directory exists, False otherwise
     """
-    return Path(org_dir).exists() 
\ No newline at end of file
+    return _org_directory_exists(org_dir, int(time.monotonic() // ORG_DIR_CHECK_INTERVAL))
+
+
+@lru_cache(maxsize=8)
+def _org_directory_exists(org_dir: str, epoch: int) -> bool:
+    # epoch changes every ORG_DIR_CHECK_INTERVAL seconds, expiring the cached answer
+    return Path(org_dir).exists()